@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import dataclasses
-import json
 from collections import OrderedDict, defaultdict
+from operator import itemgetter
 from typing import DefaultDict, Dict, List, Optional, cast
 
 from marshmallow import EXCLUDE
@@ -20,6 +19,7 @@ from starknet_py.abi.v0.shape import (
     StructMemberDict,
     TypedMemberDict,
 )
+from starknet_py.cairo._structure_resolver import resolve_order
 from starknet_py.cairo.data_types import CairoType, StructType
 from starknet_py.cairo.type_parser import TypeParser
 
@@ -46,11 +46,11 @@ class AbiParser:
 
         :param abi_list: Contract's ABI as a list of dictionaries.
         """
-        abi = [
-            ContractAbiEntrySchema().load(entry, unknown=EXCLUDE) for entry in abi_list
-        ]
+        # Entries are validated and grouped one by one, one schema instance is enough for all of them.
+        schema = ContractAbiEntrySchema()
         grouped = defaultdict(list)
-        for entry in abi:
+        for raw_entry in abi_list:
+            entry = schema.load(raw_entry, unknown=EXCLUDE)
             assert isinstance(entry, dict)
             grouped[entry["type"]].append(entry)
 
@@ -125,15 +125,15 @@ class AbiParser:
         # topological sorting with an additional "unresolved type", so this flow is much easier.
         for name, struct in structs_dict.items():
             structs[name] = StructType(name, OrderedDict())
-            without_offset = [
-                member for member in struct["members"] if member.get("offset") is None
-            ]
-            with_offset = [
-                member for member in struct["members"] if member not in without_offset
-            ]
-            struct_members[name] = sorted(
-                with_offset, key=lambda member: member["offset"]  # pyright: ignore
-            )
+            with_offset: List[StructMemberDict] = []
+            without_offset: List[StructMemberDict] = []
+            for member in struct["members"]:
+                if member.get("offset") is None:
+                    without_offset.append(member)
+                else:
+                    with_offset.append(member)
+            with_offset.sort(key=itemgetter("offset"))
+            struct_members[name] = with_offset
             for member in without_offset:
                 member["offset"] = (
                     struct_members[name][-1].get("offset", 0) + 1
@@ -159,10 +159,8 @@ class AbiParser:
 
     @staticmethod
     def _check_for_cycles(structs: Dict[str, StructType]):
-        # We want to avoid creating our own cycle checker as it would make it more complex. json module has a built-in
-        # checker for cycles.
         try:
-            _to_json(structs)
+            resolve_order(structs)
         except ValueError as err:
             raise AbiParsingError(err) from ValueError
 
@@ -202,15 +200,3 @@ class AbiParser:
                 )
             grouped[name] = entry
         return grouped
-
-
-def _to_json(value):
-    class DataclassSupportingEncoder(json.JSONEncoder):
-        def default(self, o):
-            # Dataclasses are not supported by json. Additionally, dataclasses.asdict() works recursively and doesn't
-            # check for cycles, so we need to flatten dataclasses (by ONE LEVEL) ourselves.
-            if dataclasses.is_dataclass(o):
-                return tuple(getattr(o, field.name) for field in dataclasses.fields(o))
-            return super().default(o)
-
-    return json.dumps(value, cls=DataclassSupportingEncoder)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import dataclasses
 import json
 import os
 from collections import OrderedDict, defaultdict
@@ -20,6 +19,7 @@ from starknet_py.abi.v1.shape import (
     FunctionDict,
     TypedParameterDict,
 )
+from starknet_py.cairo._structure_resolver import resolve_order
 from starknet_py.cairo.data_types import CairoType, EnumType, StructType
 from starknet_py.cairo.v1.type_parser import TypeParser
 
@@ -51,11 +51,11 @@ class AbiParser:
             Path(os.path.dirname(__file__)) / "core_structures.json"
         ).read_text("utf-8")
         abi_list = json.loads(core_structures)["abi"] + abi_list
-        abi = [
-            ContractAbiEntrySchema().load(entry, unknown=EXCLUDE) for entry in abi_list
-        ]
+        # Entries are validated and grouped one by one, one schema instance is enough for all of them.
+        schema = ContractAbiEntrySchema()
         grouped = defaultdict(list)
-        for entry in abi:
+        for raw_entry in abi_list:
+            entry = schema.load(raw_entry, unknown=EXCLUDE)
             assert isinstance(entry, dict)
             grouped[entry["type"]].append(entry)
 
@@ -160,10 +160,8 @@ class AbiParser:
 
     @staticmethod
     def _check_for_cycles(structs: Dict[str, Union[StructType, EnumType]]):
-        # We want to avoid creating our own cycle checker as it would make it more complex. json module has a built-in
-        # checker for cycles.
         try:
-            _to_json(structs)
+            resolve_order(structs)
         except ValueError as err:
             raise AbiParsingError(err) from ValueError
 
@@ -206,15 +204,3 @@ class AbiParser:
                 )
             grouped[name] = entry
         return grouped
-
-
-def _to_json(value):
-    class DataclassSupportingEncoder(json.JSONEncoder):
-        def default(self, o):
-            # Dataclasses are not supported by json. Additionally, dataclasses.asdict() works recursively and doesn't
-            # check for cycles, so we need to flatten dataclasses (by ONE LEVEL) ourselves.
-            if dataclasses.is_dataclass(o):
-                return tuple(getattr(o, field.name) for field in dataclasses.fields(o))
-            return super().default(o)
-
-    return json.dumps(value, cls=DataclassSupportingEncoder)
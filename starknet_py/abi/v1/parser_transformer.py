@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, List, Optional
 
 import lark
@@ -159,6 +160,16 @@ class ParserTransformer(Transformer):
         return TupleType(types)
 
 
+@lru_cache(maxsize=None)
+def _get_grammar_parser() -> lark.Lark:
+    # Building the parser from grammar is much more expensive than parsing a single type, so it is done only once.
+    return lark.Lark(
+        grammar=ABI_EBNF,
+        start="type",
+        parser="earley",
+    )
+
+
 def parse(
     code: str,
     type_identifiers,
@@ -166,12 +177,7 @@ def parse(
     """
     Parse the given string and return a CairoType.
     """
-    grammar_parser = lark.Lark(
-        grammar=ABI_EBNF,
-        start="type",
-        parser="earley",
-    )
-    parsed = grammar_parser.parse(code)
+    parsed = _get_grammar_parser().parse(code)
 
     parser_transformer = ParserTransformer(type_identifiers)
     cairo_type = parser_transformer.transform(parsed)
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import dataclasses
-import json
 from collections import OrderedDict, defaultdict
 from typing import DefaultDict, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
@@ -27,6 +25,7 @@ from starknet_py.abi.v2.shape import (
     InterfaceDict,
     TypedParameterDict,
 )
+from starknet_py.cairo._structure_resolver import resolve_order
 from starknet_py.cairo.data_types import CairoType, EnumType, EventType, StructType
 from starknet_py.cairo.v2.type_parser import TypeParser
 
@@ -53,11 +52,11 @@ class AbiParser:
 
         :param abi_list: Contract's ABI as a list of dictionaries.
         """
-        abi = [
-            ContractAbiEntrySchema().load(entry, unknown=EXCLUDE) for entry in abi_list
-        ]
+        # Entries are validated and grouped one by one, one schema instance is enough for all of them.
+        schema = ContractAbiEntrySchema()
         grouped = defaultdict(list)
-        for entry in abi:
+        for raw_entry in abi_list:
+            entry = schema.load(raw_entry, unknown=EXCLUDE)
             assert isinstance(entry, dict)
             grouped[entry["type"]].append(entry)
 
@@ -203,10 +202,8 @@ class AbiParser:
 
     @staticmethod
     def _check_for_cycles(structs: Dict[str, Union[StructType, EnumType]]):
-        # We want to avoid creating our own cycle checker as it would make it more complex. json module has a built-in
-        # checker for cycles.
         try:
-            _to_json(structs)
+            resolve_order(structs)
         except ValueError as err:
             raise AbiParsingError(err) from ValueError
 
@@ -279,15 +276,3 @@ class AbiParser:
                 )
             grouped[name] = entry
         return grouped
-
-
-def _to_json(value):
-    class DataclassSupportingEncoder(json.JSONEncoder):
-        def default(self, o):
-            # Dataclasses are not supported by json. Additionally, dataclasses.asdict() works recursively and doesn't
-            # check for cycles, so we need to flatten dataclasses (by ONE LEVEL) ourselves.
-            if dataclasses.is_dataclass(o):
-                return tuple(getattr(o, field.name) for field in dataclasses.fields(o))
-            return super().default(o)
-
-    return json.dumps(value, cls=DataclassSupportingEncoder)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, List, Optional
 
 import lark
@@ -164,6 +165,16 @@ class ParserTransformer(Transformer):
         return TupleType(types)
 
 
+@lru_cache(maxsize=None)
+def _get_grammar_parser() -> lark.Lark:
+    # Building the parser from grammar is much more expensive than parsing a single type, so it is done only once.
+    return lark.Lark(
+        grammar=ABI_EBNF,
+        start="type",
+        parser="earley",
+    )
+
+
 def parse(
     code: str,
     type_identifiers,
@@ -171,12 +182,7 @@ def parse(
     """
     Parse the given string and return a CairoType.
     """
-    grammar_parser = lark.Lark(
-        grammar=ABI_EBNF,
-        start="type",
-        parser="earley",
-    )
-    parsed_lark_tree = grammar_parser.parse(code)
+    parsed_lark_tree = _get_grammar_parser().parse(code)
 
     parser_transformer = ParserTransformer(type_identifiers)
     cairo_type = parser_transformer.transform(parsed_lark_tree)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Mapping, Tuple
+
+from starknet_py.cairo.data_types import (
+    ArrayType,
+    CairoType,
+    EnumType,
+    EventType,
+    NamedTupleType,
+    OptionType,
+    StructType,
+    TupleType,
+)
+
+# Types that are defined once in the abi and referenced by name everywhere else.
+_NAMED_TYPES = (StructType, EnumType, EventType)
+
+
+def resolve_order(defined_types: Mapping[str, CairoType]) -> List[str]:
+    """
+    Orders defined types so that every type comes after all types it depends on (Kahn's algorithm).
+
+    :param defined_types: dictionary containing all defined types, keyed by their names.
+    :raises ValueError: when defined types reference each other in a cycle.
+    :return: names of defined types in topological order.
+    """
+    # Types are identified by their position in `names`, so the loop below works on lists instead of dicts.
+    names = list(defined_types)
+    indices = {name: index for index, name in enumerate(names)}
+
+    inline_dependencies: Dict[int, Tuple[str, ...]] = {}
+    # Types defined outside of `defined_types` can't be part of a cycle, so they are skipped.
+    dependencies = [
+        [
+            indices[dependency]
+            for dependency in _named_dependencies(
+                defined_types[name], inline_dependencies
+            )
+            if dependency in indices
+        ]
+        for name in names
+    ]
+
+    # Reverse graph: type -> types that depend on it.
+    dependants: List[List[int]] = [[] for _ in names]
+    unresolved_dependencies_left = [len(deps) for deps in dependencies]
+    for index, type_dependencies in enumerate(dependencies):
+        for dependency in type_dependencies:
+            dependants[dependency].append(index)
+
+    resolvable_types: Deque[int] = deque(
+        index for index, left in enumerate(unresolved_dependencies_left) if left == 0
+    )
+    order: List[int] = []
+    while resolvable_types:
+        index = resolvable_types.popleft()
+        order.append(index)
+        for dependant in dependants[index]:
+            unresolved_dependencies_left[dependant] -= 1
+            if unresolved_dependencies_left[dependant] == 0:
+                resolvable_types.append(dependant)
+
+    if len(order) != len(names):
+        cycle = _find_cycle(dependencies, unresolved_dependencies_left)
+        cycle_names = " -> ".join(names[index] for index in cycle)
+        raise ValueError(f"Circular reference detected: {cycle_names}.")
+
+    return [names[index] for index in order]
+
+
+def _find_cycle(
+    dependencies: List[List[int]], unresolved_dependencies_left: List[int]
+) -> List[int]:
+    """
+    Finds a cycle among types that could not be ordered. Every such type depends on at least one other unordered
+    type, so following those dependencies has to come back to an already visited type.
+    """
+    index = next(
+        index for index, left in enumerate(unresolved_dependencies_left) if left
+    )
+    path_positions: Dict[int, int] = {}
+    path = []
+    while index not in path_positions:
+        path_positions[index] = len(path)
+        path.append(index)
+        index = next(
+            dependency
+            for dependency in dependencies[index]
+            if unresolved_dependencies_left[dependency]
+        )
+    return path[path_positions[index] :] + [index]
+
+
+def _named_dependencies(
+    defined_type: CairoType, inline_dependencies: Dict[int, Tuple[str, ...]]
+) -> List[str]:
+    """
+    Collects names of defined types referenced by members of `defined_type`. Referenced types are not traversed.
+
+    :param inline_dependencies: names referenced by already visited inline types, keyed by id of the type. Inline
+        types are shared between members parsed from the same type string, so each of them is traversed only once.
+    """
+    names: Dict[str, None] = {}
+    for member_type in _member_types(defined_type):
+        if isinstance(member_type, _NAMED_TYPES):
+            names[member_type.name] = None
+        else:
+            _collect_inline_dependencies(member_type, inline_dependencies)
+            names.update(dict.fromkeys(inline_dependencies[id(member_type)]))
+    return list(names)
+
+
+def _collect_inline_dependencies(
+    inline_type: CairoType, inline_dependencies: Dict[int, Tuple[str, ...]]
+):
+    # Iterative post-order: a type is visited again once all of its inline children have their names collected.
+    stack: List[Tuple[CairoType, bool]] = [(inline_type, False)]
+    while stack:
+        cairo_type, children_visited = stack.pop()
+        if id(cairo_type) in inline_dependencies:
+            continue
+
+        children = _member_types(cairo_type)
+        if not children_visited:
+            stack.append((cairo_type, True))
+            stack.extend(
+                (child, False)
+                for child in children
+                if not isinstance(child, _NAMED_TYPES)
+            )
+            continue
+
+        names: Dict[str, None] = {}
+        for child in children:
+            if isinstance(child, _NAMED_TYPES):
+                names[child.name] = None
+            else:
+                names.update(dict.fromkeys(inline_dependencies[id(child)]))
+        inline_dependencies[id(cairo_type)] = tuple(names)
+
+
+def _member_types(cairo_type: CairoType) -> Iterable[CairoType]:
+    if isinstance(cairo_type, (StructType, EventType, NamedTupleType)):
+        return cairo_type.types.values()
+    if isinstance(cairo_type, EnumType):
+        return cairo_type.variants.values()
+    if isinstance(cairo_type, TupleType):
+        return cairo_type.types
+    if isinstance(cairo_type, ArrayType):
+        return (cairo_type.inner_type,)
+    if isinstance(cairo_type, OptionType):
+        return (cairo_type.type,)
+    return ()
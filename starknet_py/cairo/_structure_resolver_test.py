@@ -0,0 +1,73 @@
+from collections import OrderedDict
+
+import pytest
+
+from starknet_py.cairo._structure_resolver import resolve_order
+from starknet_py.cairo.data_types import (
+    ArrayType,
+    EnumType,
+    FeltType,
+    OptionType,
+    StructType,
+    TupleType,
+)
+
+
+def test_resolve_order():
+    uint256 = StructType("Uint256", OrderedDict(low=FeltType(), high=FeltType()))
+    pair = StructType("Pair", OrderedDict(first=uint256, second=uint256))
+    result = EnumType(
+        "Result", OrderedDict(ok=OptionType(pair), err=ArrayType(FeltType()))
+    )
+    user = StructType(
+        "User", OrderedDict(balances=TupleType([uint256, ArrayType(pair)]))
+    )
+
+    order = resolve_order(
+        {"User": user, "Result": result, "Pair": pair, "Uint256": uint256}
+    )
+
+    assert sorted(order) == ["Pair", "Result", "Uint256", "User"]
+    assert order.index("Uint256") < order.index("Pair") < order.index("Result")
+    assert order.index("Pair") < order.index("User")
+
+
+def test_resolve_order_ignores_types_not_defined():
+    uint256 = StructType("Uint256", OrderedDict(low=FeltType(), high=FeltType()))
+    user = StructType("User", OrderedDict(id=uint256))
+
+    assert resolve_order({"User": user}) == ["User"]
+
+
+def test_resolve_order_cycle_through_inline_types():
+    first = StructType("First", OrderedDict())
+    second = StructType("Second", OrderedDict(value=ArrayType(TupleType([first]))))
+    first.types.update(value=OptionType(second))
+
+    with pytest.raises(
+        ValueError, match="Circular reference detected: First -> Second -> First."
+    ):
+        resolve_order({"First": first, "Second": second})
+
+
+def test_resolve_order_reports_only_types_in_cycle():
+    first = StructType("First", OrderedDict())
+    second = StructType("Second", OrderedDict(value=first))
+    first.types.update(value=second)
+    user = StructType("User", OrderedDict(value=first))
+
+    with pytest.raises(
+        ValueError, match="Circular reference detected: First -> Second -> First."
+    ):
+        resolve_order({"User": user, "First": first, "Second": second})
+
+
+def test_resolve_order_shared_inline_type():
+    uint256 = StructType("Uint256", OrderedDict(low=FeltType(), high=FeltType()))
+    balances = ArrayType(TupleType([FeltType(), uint256]))
+    user = StructType("User", OrderedDict(balances=balances))
+    pool = StructType("Pool", OrderedDict(balances=balances, owner=user))
+
+    order = resolve_order({"Pool": pool, "User": user, "Uint256": uint256})
+
+    assert order == ["Uint256", "User", "Pool"]
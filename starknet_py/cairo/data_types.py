@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List
+from typing import ClassVar, Dict, List
 
 
 class CairoType(ABC):
@@ -11,20 +11,44 @@ class CairoType(ABC):
     Base type for all Cairo type representations. All types extend it.
     """
 
+    # Abi contains a lot of types, so they declare __slots__ to keep instances small. It must be declared by every
+    # subclass, otherwise instances get a __dict__ anyway.
+    __slots__ = ()
+
+
+class _StatelessType(CairoType):
+    """
+    Base for types without any fields. Every instance of such type would be the same, so a single instance is shared
+    instead of allocating a new one for every occurrence in the abi.
+    """
+
+    __slots__ = ()
+
+    _instances: ClassVar[Dict[type, CairoType]] = {}
+
+    def __new__(cls):
+        if cls not in _StatelessType._instances:
+            _StatelessType._instances[cls] = super().__new__(cls)
+        return _StatelessType._instances[cls]
+
 
 @dataclass
-class FeltType(CairoType):
+class FeltType(_StatelessType):
     """
     Type representation of Cairo field element.
     """
 
+    __slots__ = ()
+
 
 @dataclass
-class BoolType(CairoType):
+class BoolType(_StatelessType):
     """
     Type representation of Cairo boolean.
     """
 
+    __slots__ = ()
+
 
 @dataclass
 class TupleType(CairoType):
@@ -32,6 +56,8 @@ class TupleType(CairoType):
     Type representation of Cairo tuples without named fields.
     """
 
+    __slots__ = ("types",)
+
     types: List[CairoType]  #: types of every tuple element.
 
 
@@ -41,6 +67,8 @@ class NamedTupleType(CairoType):
     Type representation of Cairo tuples with named fields.
     """
 
+    __slots__ = ("types",)
+
     types: OrderedDict[str, CairoType]  #: types of every tuple member.
 
 
@@ -50,6 +78,8 @@ class ArrayType(CairoType):
     Type representation of Cairo arrays.
     """
 
+    __slots__ = ("inner_type",)
+
     inner_type: CairoType  #: type of element inside array.
 
 
@@ -59,6 +89,8 @@ class StructType(CairoType):
     Type representation of Cairo structures.
     """
 
+    __slots__ = ("name", "types")
+
     name: str  #: Structure name
     # We need ordered dict, because it is important in serialization
     types: OrderedDict[str, CairoType]  #: types of every structure member.
@@ -70,6 +102,8 @@ class EnumType(CairoType):
     Type representation of Cairo enums.
     """
 
+    __slots__ = ("name", "variants")
+
     name: str
     variants: OrderedDict[str, CairoType]
 
@@ -80,6 +114,8 @@ class OptionType(CairoType):
     Type representation of Cairo options.
     """
 
+    __slots__ = ("type",)
+
     type: CairoType
 
 
@@ -89,6 +125,8 @@ class UintType(CairoType):
     Type representation of Cairo unsigned integers.
     """
 
+    __slots__ = ("bits",)
+
     bits: int
 
     def check_range(self, value: int):
@@ -103,15 +141,19 @@ class TypeIdentifier(CairoType):
     Type representation of Cairo identifiers.
     """
 
+    __slots__ = ("name",)
+
     name: str
 
 
 @dataclass
-class UnitType(CairoType):
+class UnitType(_StatelessType):
     """
     Type representation of Cairo unit `()`.
     """
 
+    __slots__ = ()
+
 
 @dataclass
 class EventType(CairoType):
@@ -119,5 +161,7 @@ class EventType(CairoType):
     Type representation of Cairo Event.
     """
 
+    __slots__ = ("name", "types")
+
     name: str
     types: OrderedDict[str, CairoType]
@@ -0,0 +1,37 @@
+import copy
+from collections import OrderedDict
+
+import pytest
+
+from starknet_py.cairo.data_types import (
+    ArrayType,
+    BoolType,
+    FeltType,
+    StructType,
+    TupleType,
+    UnitType,
+)
+
+
+@pytest.mark.parametrize("type_class", [FeltType, BoolType, UnitType])
+def test_stateless_types_are_shared(type_class):
+    cairo_type = type_class()
+
+    assert type_class() is cairo_type
+    assert copy.deepcopy(cairo_type) is cairo_type
+    assert isinstance(cairo_type, type_class)
+
+
+def test_stateless_types_are_distinct():
+    assert FeltType() != BoolType()
+    assert BoolType() is not UnitType()
+
+
+def test_types_have_no_instance_dict():
+    struct = StructType("Uint256", OrderedDict(low=FeltType(), high=FeltType()))
+    array = ArrayType(TupleType([struct, BoolType()]))
+
+    for cairo_type in (struct, array, array.inner_type, FeltType()):
+        assert not hasattr(cairo_type, "__dict__")
+
+    assert copy.deepcopy(array) == array
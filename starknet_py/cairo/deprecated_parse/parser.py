@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import lark
 
 from starknet_py.cairo.deprecated_parse.cairo_types import CairoType
@@ -27,20 +29,21 @@ CAIRO_EBNF = """
 """
 
 
-def parse(code: str) -> CairoType:
-    """
-    Parses the given string and returns a CairoType.
-    """
-
-    grammar = CAIRO_EBNF
-
-    grammar_parser = lark.Lark(
-        grammar=grammar,
+@lru_cache(maxsize=None)
+def _get_grammar_parser() -> lark.Lark:
+    # Building the parser from grammar is much more expensive than parsing a single type, so it is done only once.
+    return lark.Lark(
+        grammar=CAIRO_EBNF,
         start=["type"],
         parser="lalr",
     )
 
-    parsed = grammar_parser.parse(code)
+
+def parse(code: str) -> CairoType:
+    """
+    Parses the given string and returns a CairoType.
+    """
+    parsed = _get_grammar_parser().parse(code)
     transformed = ParserTransformer().transform(parsed)
 
     return transformed
@@ -7,6 +7,8 @@ CairoData = List[int]
 
 MAX_UINT256 = (1 << 256) - 1
 MIN_UINT256 = 0
+# Also a mask of the lower 128 bits, used to split uint256 into low and high parts.
+MAX_UINT128 = (1 << 128) - 1
 
 
 def uint256_range_check(value: int):
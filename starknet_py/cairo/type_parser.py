@@ -33,6 +33,8 @@ class TypeParser:
     """
 
     defined_types: Dict[str, StructType]
+    # Results of parse_inline_type keyed by the type string, the same types are used many times in a single abi.
+    _parsed_types: Dict[str, CairoType]
 
     def __init__(self, defined_types: Dict[str, StructType]):
         """
@@ -41,6 +43,7 @@ class TypeParser:
         :param defined_types: dictionary containing all defined types. For now, they can only be structures.
         """
         self.defined_types = defined_types
+        self._parsed_types = {}
         for name, struct in defined_types.items():
             if name != struct.name:
                 raise ValueError(
@@ -55,8 +58,10 @@ class TypeParser:
 
         :param type_string: type to parse.
         """
-        parsed = parse(type_string)
-        return self._transform_cairo_lang_type(parsed)
+        if type_string not in self._parsed_types:
+            parsed = parse(type_string)
+            self._parsed_types[type_string] = self._transform_cairo_lang_type(parsed)
+        return self._parsed_types[type_string]
 
     def _transform_cairo_lang_type(
         self, cairo_type: cairo_lang_types.CairoType
@@ -118,3 +118,11 @@ def test_names_not_matching():
         ValueError, match="Keys must match name of type, 'OtherName' != 'Uint256'."
     ):
         TypeParser({"OtherName": uint256_type})
+
+
+def test_parsed_types_are_reused():
+    parser = TypeParser({"Uint256": uint256_type})
+
+    parsed = parser.parse_inline_type("(Uint256, felt*)")
+
+    assert parser.parse_inline_type("(Uint256, felt*)") is parsed
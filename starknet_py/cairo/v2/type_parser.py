@@ -33,6 +33,8 @@ class TypeParser:
     """
 
     defined_types: Dict[str, Union[StructType, EnumType, EventType]]
+    # Results of parse_inline_type keyed by the type string, the same types are used many times in a single abi.
+    _parsed_types: Dict[str, CairoType]
 
     def __init__(
         self, defined_types: Dict[str, Union[StructType, EnumType, EventType]]
@@ -43,6 +45,7 @@ class TypeParser:
         :param defined_types: dictionary containing all defined types. For now, they can only be structures.
         """
         self.defined_types = defined_types
+        self._parsed_types = {}
         for name, defined_type in defined_types.items():
             if name != defined_type.name:
                 raise ValueError(
@@ -53,11 +56,13 @@ class TypeParser:
         self, defined_types: Dict[str, Union[StructType, EnumType, EventType]]
     ) -> None:
         self.defined_types.update(defined_types)
+        self._parsed_types.clear()
 
     def add_defined_type(
         self, defined_type: Union[StructType, EnumType, EventType]
     ) -> None:
         self.defined_types.update({defined_type.name: defined_type})
+        self._parsed_types.clear()
 
     def parse_inline_type(self, type_string: str) -> CairoType:
         """
@@ -67,6 +72,11 @@ class TypeParser:
 
         :param type_string: type to parse.
         """
+        if type_string not in self._parsed_types:
+            self._parsed_types[type_string] = self._parse_inline_type(type_string)
+        return self._parsed_types[type_string]
+
+    def _parse_inline_type(self, type_string: str) -> CairoType:
         parsed = parse(type_string, self.defined_types)
         if isinstance(parsed, TypeIdentifier):
             for defined_name in self.defined_types.keys():
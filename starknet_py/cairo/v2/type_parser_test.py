@@ -108,3 +108,15 @@ def test_names_not_matching():
         ValueError, match="Keys must match name of type, 'OtherName' != 'Uint256'."
     ):
         TypeParser({"OtherName": uint256_type})
+
+
+def test_parsed_types_are_reused_until_defined_types_change():
+    parser = TypeParser({})
+    parsed = parser.parse_inline_type("(core::felt252, core::bool)")
+    assert parser.parse_inline_type("(core::felt252, core::bool)") is parsed
+
+    with pytest.raises(UnknownCairoTypeError):
+        parser.parse_inline_type("Uint256")
+
+    parser.add_defined_type(uint256_type)
+    assert parser.parse_inline_type("Uint256") == uint256_type
@@ -3,7 +3,6 @@ from __future__ import annotations
 import dataclasses
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from functools import cached_property
 from typing import Dict, List, Optional, TypeVar, Union
 
 from marshmallow import ValidationError
@@ -43,6 +42,7 @@ from starknet_py.serialization import (
     serializer_for_function,
 )
 from starknet_py.serialization.factory import serializer_for_function_v1
+from starknet_py.utils.cached_property import cached_property
 from starknet_py.utils.constructor_args_translator import (
     _is_abi_v2,
     translate_constructor_args,
@@ -1108,14 +1108,19 @@ class Contract:
         cairo_version: int = 0,
     ) -> FunctionsRepository:
         repository = {}
-        implemented_interfaces = [
-            entry["interface_name"]
-            for entry in contract_data.abi
-            if entry["type"] == IMPL_ENTRY
-        ]
-
+        # Interfaces can be listed before the impls implementing them, so functions are created after a single pass
+        # which collects both.
+        implemented_interfaces = set()
+        function_entries = []
         for abi_entry in contract_data.abi:
-            if abi_entry["type"] in [FUNCTION_ENTRY, L1_HANDLER_ENTRY]:
+            entry_type = abi_entry["type"]
+            if entry_type == IMPL_ENTRY:
+                implemented_interfaces.add(abi_entry["interface_name"])
+            elif entry_type in (FUNCTION_ENTRY, L1_HANDLER_ENTRY, INTERFACE_ENTRY):
+                function_entries.append(abi_entry)
+
+        for abi_entry in function_entries:
+            if abi_entry["type"] != INTERFACE_ENTRY:
                 name = abi_entry["name"]
                 repository[name] = ContractFunction(
                     name=name,
@@ -1126,10 +1131,7 @@ class Contract:
                     cairo_version=cairo_version,
                 )
 
-            if (
-                abi_entry["type"] == INTERFACE_ENTRY
-                and abi_entry["name"] in implemented_interfaces
-            ):
+            elif abi_entry["name"] in implemented_interfaces:
                 for item in abi_entry["items"]:
                     name = item["name"]
                     repository[name] = ContractFunction(
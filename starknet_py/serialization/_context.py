@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC
 from contextlib import contextmanager
-from typing import Any, Generator, Iterator, List
+from typing import Any, Iterator, List
 
 from starknet_py.serialization._calldata_reader import (
     CairoData,
@@ -12,6 +12,28 @@ from starknet_py.serialization._calldata_reader import (
 from starknet_py.serialization.errors import InvalidTypeException, InvalidValueException
 
 
+class _EntityScope:
+    """
+    Context manager returned by Context.push_entity. It is entered for every (de)serialized value, so it is a plain
+    class instead of a @contextmanager generator, which is several times more expensive to create and enter.
+    """
+
+    __slots__ = ("_namespace_stack", "_name")
+
+    def __init__(self, namespace_stack: List[str], name: str):
+        self._namespace_stack = namespace_stack
+        self._name = name
+
+    def __enter__(self):
+        self._namespace_stack.append(self._name)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # This ensures the name will be popped if everything is ok. In case an exception is raised we want the stack to
+        # be filled to wrap the error at the end.
+        if exc_type is None:
+            self._namespace_stack.pop()
+
+
 class Context(ABC):
     """
     Holds information about context when (de)serializing data. This is needed to inform what and where went
@@ -32,19 +54,14 @@ class Context(ABC):
         """
         return ".".join(self._namespace_stack)
 
-    @contextmanager
-    def push_entity(self, name: str) -> Generator:
+    def push_entity(self, name: str) -> _EntityScope:
         """
         Manager used for maintaining information about names of (de)serialized types. Wraps some errors with
         custom errors, adding information about the context.
 
         :param name: name of (de)serialized entity.
         """
-        # This ensures the name will be popped if everything is ok. In case an exception is raised we want the stack to
-        # be filled to wrap the error at the end.
-        self._namespace_stack.append(name)
-        yield
-        self._namespace_stack.pop()
+        return _EntityScope(self._namespace_stack, name)
 
     def ensure_valid_value(self, valid: bool, text: str):
         if not valid:
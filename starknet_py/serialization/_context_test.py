@@ -15,3 +15,20 @@ def test_if_exceptions_are_wrapped(initial_exception, wrapped_class):
     with pytest.raises(wrapped_class, match="Error: Test"):
         with SerializationContext.create():
             raise initial_exception
+
+
+def test_push_entity():
+    with SerializationContext.create() as context:
+        with context.push_entity("a"):
+            with context.push_entity("[0]"):
+                assert context.current_entity == "a.[0]"
+            assert context.current_entity == "a"
+        assert context.current_entity == ""
+
+
+def test_push_entity_error_path():
+    with pytest.raises(InvalidValueException, match="Error at path 'a.b': Test"):
+        with SerializationContext.create() as context:
+            with context.push_entity("a"):
+                with context.push_entity("b"):
+                    raise ValueError("Test")
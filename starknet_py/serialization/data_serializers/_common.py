@@ -1,7 +1,8 @@
 # We have to use parametrised type from typing
 from collections import OrderedDict as _OrderedDict
-from typing import Dict, Generator, List, OrderedDict
+from typing import Callable, Dict, Generator, Iterable, List, OrderedDict
 
+from starknet_py.cairo.felt import is_in_felt_range
 from starknet_py.serialization._context import (
     DeserializationContext,
     SerializationContext,
@@ -9,9 +10,11 @@ from starknet_py.serialization._context import (
 from starknet_py.serialization.data_serializers.cairo_data_serializer import (
     CairoDataSerializer,
 )
+from starknet_py.serialization.data_serializers.felt_serializer import FeltSerializer
 
 # The actual serialization logic is very similar among all serializers: they either serialize data based on
 # position or their name. Having this logic reused adds indirection, but makes sure proper logic is used everywhere.
+# Those helpers run for every (de)serialized field, so methods used inside loops are bound to locals once.
 
 
 def deserialize_to_list(
@@ -21,10 +24,11 @@ def deserialize_to_list(
     Deserializes data from context to list. This logic is used in every sequential type (arrays and tuples).
     """
     result = []
+    push_entity, append = context.push_entity, result.append
 
     for index, serializer in enumerate(deserializers):
-        with context.push_entity(f"[{index}]"):
-            result.append(serializer.deserialize_with_context(context))
+        with push_entity(f"[{index}]"):
+            append(serializer.deserialize_with_context(context))
 
     return result
 
@@ -37,10 +41,19 @@ def deserialize_to_dict(
     Deserializes data from context to dictionary. This logic is used in every type with named fields (structs,
     named tuples and payloads).
     """
+    if 0 < len(deserializers) <= context.reader.remaining_len and all(
+        map(is_felt_serializer, deserializers.values())
+    ):
+        names = list(deserializers)
+        return _OrderedDict(
+            zip(names, read_felts(context, len(names), names.__getitem__))
+        )
+
     result = _OrderedDict()
+    push_entity = context.push_entity
 
     for key, serializer in deserializers.items():
-        with context.push_entity(key):
+        with push_entity(key):
             result[key] = serializer.deserialize_with_context(context)
 
     return result
@@ -57,8 +70,9 @@ def serialize_from_list(
         f"expected {len(serializers)} elements, {len(values)} provided",
     )
 
+    push_entity = context.push_entity
     for index, (serializer, value) in enumerate(zip(serializers, values)):
-        with context.push_entity(f"[{index}]"):
+        with push_entity(f"[{index}]"):
             yield from serializer.serialize_with_context(context, value)
 
 
@@ -76,7 +90,51 @@ def serialize_from_dict(
         f"unexpected keys '{','.join(excessive_keys)}' were provided",
     )
 
+    if all(map(is_felt_serializer, serializers.values())) and all(
+        name in values for name in serializers
+    ):
+        felts = [values[name] for name in serializers]
+        if are_valid_felts(felts):
+            yield from felts
+            return
+
+    push_entity, ensure_valid_value = context.push_entity, context.ensure_valid_value
     for name, serializer in serializers.items():
-        with context.push_entity(name):
-            context.ensure_valid_value(name in values, f"key '{name}' is missing")
+        with push_entity(name):
+            ensure_valid_value(name in values, f"key '{name}' is missing")
             yield from serializer.serialize_with_context(context, values[name])
+
+
+# Felts are (de)serialized as they are, so a group of them can be checked and read at once instead of going through
+# FeltSerializer one by one. Errors have to stay the same as when (de)serializing felts one by one.
+
+
+def is_felt_serializer(serializer: CairoDataSerializer) -> bool:
+    # Subclasses of FeltSerializer could change how a single felt is (de)serialized.
+    return type(serializer) is FeltSerializer  # pylint: disable=unidiomatic-typecheck
+
+
+def are_valid_felts(values: Iterable) -> bool:
+    """
+    Checks if FeltSerializer would serialize all values without errors or warnings.
+    """
+    return all(isinstance(value, int) and is_in_felt_range(value) for value in values)
+
+
+def read_felts(
+    context: DeserializationContext, size: int, entity_name: Callable[[int], str]
+) -> List[int]:
+    """
+    Reads `size` felts at once. The caller has to make sure there is enough data to read.
+
+    :param entity_name: name of the entity at a given position, used to report an invalid felt.
+    """
+    values = context.reader.read(size)
+    if not all(map(is_in_felt_range, values)):
+        index = next(
+            index for index, value in enumerate(values) if not is_in_felt_range(value)
+        )
+        with context.push_entity(entity_name(index)):
+            FeltSerializer.ensure_felt(context, values[index])
+
+    return values
@@ -6,7 +6,10 @@ from starknet_py.serialization._context import (
     SerializationContext,
 )
 from starknet_py.serialization.data_serializers._common import (
+    are_valid_felts,
     deserialize_to_list,
+    is_felt_serializer,
+    read_felts,
     serialize_from_list,
 )
 from starknet_py.serialization.data_serializers.cairo_data_serializer import (
@@ -32,12 +35,23 @@ class ArraySerializer(CairoDataSerializer[Iterable, List]):
         with context.push_entity("len"):
             [size] = context.reader.read(1)
 
+        if (
+            is_felt_serializer(self.inner_serializer)
+            and 0 < size <= context.reader.remaining_len
+        ):
+            return read_felts(context, size, lambda index: f"[{index}]")
+
         return deserialize_to_list([self.inner_serializer] * size, context)
 
     def serialize_with_context(
         self, context: SerializationContext, value: List
     ) -> Generator[int, None, None]:
         yield len(value)
+
+        if is_felt_serializer(self.inner_serializer) and are_valid_felts(value):
+            yield from value
+            return
+
         yield from serialize_from_list(
             [self.inner_serializer] * len(value), context, value
         )
@@ -3,6 +3,7 @@ import pytest
 from starknet_py.constants import FIELD_PRIME
 from starknet_py.serialization.data_serializers.array_serializer import ArraySerializer
 from starknet_py.serialization.data_serializers.felt_serializer import FeltSerializer
+from starknet_py.serialization.errors import InvalidTypeException, InvalidValueException
 
 felt_array_serializer = ArraySerializer(FeltSerializer())
 
@@ -26,3 +27,38 @@ def test_valid_values(serializer, value, serialized_value):
 
     assert deserialized == value
     assert serialized == serialized_value
+
+
+def test_deserialize_invalid_felt():
+    with pytest.raises(
+        InvalidValueException,
+        match=rf"Error at path '\[1\]': invalid value '{FIELD_PRIME}' - must be in \[0, {FIELD_PRIME}\) range.",
+    ):
+        felt_array_serializer.deserialize([3, 1, FIELD_PRIME, FIELD_PRIME + 1])
+
+
+def test_deserialize_not_enough_felts():
+    with pytest.raises(
+        InvalidValueException,
+        match=r"Not enough data to deserialize '\[2\]'. Can't read 1 values at position 3, 0 available.",
+    ):
+        felt_array_serializer.deserialize([3, 1, 2])
+
+
+def test_serialize_invalid_felt():
+    with pytest.raises(
+        InvalidValueException,
+        match=rf"Error at path '\[2\]': invalid value '-1' - must be in \[0, {FIELD_PRIME}\) range.",
+    ):
+        felt_array_serializer.serialize([1, 2, -1])
+
+    with pytest.raises(
+        InvalidTypeException,
+        match=r"Error at path '\[1\]': expected int, received '1.5' of type",
+    ):
+        felt_array_serializer.serialize([1, 1.5])
+
+
+def test_serialize_shortstring_felt():
+    with pytest.warns(DeprecationWarning):
+        assert felt_array_serializer.serialize([1, "a"]) == [2, 1, ord("a")]
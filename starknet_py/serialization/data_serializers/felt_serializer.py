@@ -22,7 +22,7 @@ class FeltSerializer(CairoDataSerializer[int, int]):
 
     def deserialize_with_context(self, context: DeserializationContext) -> int:
         [val] = context.reader.read(1)
-        self._ensure_felt(context, val)
+        self.ensure_felt(context, val)
         return val
 
     def serialize_with_context(
@@ -39,11 +39,11 @@ class FeltSerializer(CairoDataSerializer[int, int]):
             return
 
         context.ensure_valid_type(value, isinstance(value, int), "int")
-        self._ensure_felt(context, value)
+        self.ensure_felt(context, value)
         yield value
 
     @staticmethod
-    def _ensure_felt(context: Context, value: int):
+    def ensure_felt(context: Context, value: int):
         context.ensure_valid_value(
             is_in_felt_range(value),
             f"invalid value '{value}' - must be in [0, {FIELD_PRIME}) range",
@@ -2,13 +2,18 @@ from collections import OrderedDict
 
 import pytest
 
+from starknet_py.constants import FIELD_PRIME
 from starknet_py.serialization.data_serializers.array_serializer import ArraySerializer
 from starknet_py.serialization.data_serializers.felt_serializer import FeltSerializer
 from starknet_py.serialization.data_serializers.struct_serializer import (
     StructSerializer,
 )
+from starknet_py.serialization.errors import InvalidValueException
 
 felt_array_serializer = ArraySerializer(FeltSerializer())
+point_serializer = StructSerializer(
+    OrderedDict(x=FeltSerializer(), y=FeltSerializer(), z=FeltSerializer())
+)
 
 
 @pytest.mark.parametrize(
@@ -39,3 +44,44 @@ def test_valid_values(serializer, value, serialized_value):
 
     serialized = serializer.serialize(value)
     assert serialized == serialized_value
+
+
+def test_deserialize_felts_struct():
+    deserialized = point_serializer.deserialize([1, 2, 3])
+
+    assert isinstance(deserialized, OrderedDict)
+    assert list(deserialized.items()) == [("x", 1), ("y", 2), ("z", 3)]
+
+
+@pytest.mark.parametrize(
+    "data, error",
+    [
+        (
+            [1, FIELD_PRIME, FIELD_PRIME],
+            rf"Error at path 'y': invalid value '{FIELD_PRIME}' - must be in \[0, {FIELD_PRIME}\) range.",
+        ),
+        (
+            [1, 2],
+            r"Not enough data to deserialize 'z'. Can't read 1 values at position 2, 0 available.",
+        ),
+    ],
+)
+def test_deserialize_felts_struct_errors(data, error):
+    with pytest.raises(InvalidValueException, match=error):
+        point_serializer.deserialize(data)
+
+
+@pytest.mark.parametrize(
+    "value, error",
+    [
+        (
+            {"x": 1, "y": 2, "z": -1},
+            rf"Error at path 'z': invalid value '-1' - must be in \[0, {FIELD_PRIME}\) range.",
+        ),
+        ({"x": 1, "z": 3}, "Error at path 'y': key 'y' is missing."),
+        ({"x": 1, "y": 2, "z": 3, "w": 4}, "Error: unexpected keys 'w' were provided."),
+    ],
+)
+def test_serialize_felts_struct_errors(value, error):
+    with pytest.raises(InvalidValueException, match=error):
+        point_serializer.serialize(value)
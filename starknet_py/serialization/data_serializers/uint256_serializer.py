@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Generator, TypedDict, Union
 
-from starknet_py.cairo.felt import uint256_range_check
+from starknet_py.cairo.felt import MAX_UINT128, uint256_range_check
 from starknet_py.serialization._context import (
     Context,
     DeserializationContext,
@@ -56,7 +56,7 @@ class Uint256Serializer(CairoDataSerializer[Union[int, Uint256Dict], int]):
     @staticmethod
     def _serialize_from_int(value: int) -> Generator[int, None, None]:
         uint256_range_check(value)
-        result = (value % 2**128, value // 2**128)
+        result = (value & MAX_UINT128, value >> 128)
         yield from result
 
     def _serialize_from_dict(
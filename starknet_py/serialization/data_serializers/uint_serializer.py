@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Generator, TypedDict, Union
 
-from starknet_py.cairo.felt import uint256_range_check
+from starknet_py.cairo.felt import MAX_UINT128, uint256_range_check
 from starknet_py.serialization._context import (
     Context,
     DeserializationContext,
@@ -77,7 +77,7 @@ class UintSerializer(CairoDataSerializer[Union[int, Uint256Dict], int]):
         else:
             uint256_range_check(value)
 
-            result = (value % 2**128, value >> 128)
+            result = (value & MAX_UINT128, value >> 128)
             yield from result
 
     def _serialize_from_dict(
@@ -96,5 +96,5 @@ class UintSerializer(CairoDataSerializer[Union[int, Uint256Dict], int]):
         Ensures that value is a valid uint on `bits` bits.
         """
         context.ensure_valid_value(
-            0 <= value < 2**bits, "expected value in range [0;2**" + str(bits) + ")"
+            0 <= value < 1 << bits, "expected value in range [0;2**" + str(bits) + ")"
         )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, fields, make_dataclass
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Type
 
 
 @dataclass(frozen=True, eq=False)
@@ -49,11 +50,23 @@ class TupleDataclass:
 
     @staticmethod
     def from_dict(data: Dict, *, name: Optional[str] = None) -> TupleDataclass:
-        result_class = make_dataclass(
+        result_class = _tuple_dataclass_class(
             name or "TupleDataclass",
-            fields=[(key, type(value)) for key, value in data.items()],
-            bases=(TupleDataclass,),
-            frozen=True,
-            eq=False,
+            tuple((key, type(value)) for key, value in data.items()),
         )
         return result_class(**data)
+
+
+# Creating a dataclass is expensive (its methods are generated with exec), while deserialized values of the same
+# cairo type always have the same shape. That's why classes are reused for the same name and fields.
+@lru_cache(maxsize=1024)
+def _tuple_dataclass_class(
+    name: str, class_fields: Tuple[Tuple[str, type], ...]
+) -> Type[TupleDataclass]:
+    return make_dataclass(
+        name,
+        fields=class_fields,
+        bases=(TupleDataclass,),
+        frozen=True,
+        eq=False,
+    )
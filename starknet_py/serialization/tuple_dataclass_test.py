@@ -34,3 +34,16 @@ def test_wrapped_named_tuple():
         AttributeError, match="object has no attribute 'unknown_attribute'"
     ):
         result.unknown_attribute()
+
+
+def test_classes_are_reused_for_the_same_fields():
+    first = TupleDataclass.from_dict({"a": 1, "b": 2})
+    second = TupleDataclass.from_dict({"a": 3, "b": 4})
+
+    assert type(first) is type(second)
+    assert (first.a, first.b, second.a, second.b) == (1, 2, 3, 4)
+
+    assert type(TupleDataclass.from_dict({"b": 1, "a": 2})) is not type(first)
+    assert type(TupleDataclass.from_dict({"a": 1, "b": 2}, name="Other")) is not type(
+        first
+    )
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable, Generic, Optional, TypeVar, overload
+
+T = TypeVar("T")
+
+
+# pylint: disable=invalid-name
+class cached_property(functools.cached_property, Generic[T]):
+    """
+    Lock-free version of functools.cached_property.
+
+    Before Python 3.12 functools.cached_property holds a lock shared by all instances of the class while computing
+    the value, so for instance parsing abi of many contracts in separate threads is serialized. This descriptor
+    doesn't lock at all: when accessed concurrently before the value is cached, the value may be computed more than
+    once and the last result is kept. Like the original, it writes directly to instance's __dict__, so it also works
+    with frozen dataclasses. It subclasses the original so tools like Sphinx still recognize it as a property.
+    """
+
+    # Redefined only to bind T for type checkers, functools.cached_property isn't subscriptable in Python 3.8.
+    def __init__(  # pylint: disable=useless-parent-delegation
+        self, func: Callable[[Any], T]
+    ):
+        super().__init__(func)
+
+    @overload
+    def __get__(
+        self, instance: None, owner: Optional[type] = None
+    ) -> cached_property[T]:
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> T:
+        ...
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if self.attrname is None:
+            raise TypeError(
+                "Cannot use cached_property instance without calling __set_name__ on it."
+            )
+
+        value = self.func(instance)
+        # This is a non-data descriptor, so the value stored in __dict__ takes precedence over it on the next access.
+        instance.__dict__[self.attrname] = value
+        return value
@@ -0,0 +1,42 @@
+import functools
+from dataclasses import dataclass
+
+from starknet_py.utils.cached_property import cached_property
+
+
+@dataclass(frozen=True)
+class Counter:
+    calls: list
+
+    @cached_property
+    def value(self) -> int:
+        """
+        Value docstring.
+        """
+        self.calls.append(None)
+        return len(self.calls)
+
+
+def test_value_is_computed_once():
+    counter = Counter([])
+
+    assert counter.value == 1
+    assert counter.value == 1
+    assert counter.calls == [None]
+
+
+def test_values_are_cached_per_instance():
+    calls = []
+    first, second = Counter(calls), Counter(calls)
+
+    assert (first.value, second.value, first.value) == (1, 2, 1)
+
+
+def test_class_access():
+    assert isinstance(Counter.value, cached_property)
+    assert Counter.value.__doc__ is not None
+    assert "Value docstring." in Counter.value.__doc__
+
+
+def test_is_recognized_as_functools_cached_property():
+    assert isinstance(Counter.value, functools.cached_property)